@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import aiohttp
 from pyytlounge import YtLoungeApi
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryAuthFailed
@@ -20,6 +21,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     api = YtLoungeApi(device_name(hass), logger=LOGGER)
+    # swap in a small dedicated pool so the subscribe long-poll and snippet
+    # fetches keep their connections alive; YtLoungeApi has no session kwarg
+    await api.close()
+    api.conn = aiohttp.TCPConnector(
+        limit=10,
+        limit_per_host=4,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        ttl_dns_cache=300,
+    )
+    api.session = aiohttp.ClientSession(connector=api.conn)
     api.auth.deserialize(entry.data["auth"])
 
     if not api.paired():
@@ -35,6 +47,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # try refresh auth first
     if await api.refresh_auth():
+        # persist refreshed tokens so the next startup can skip this round trip
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, "auth": api.auth.serialize()}
+        )
         if await api.connect():
             await create_entry()
             return True
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from dataclasses import dataclass
 
-from aiogoogle import Aiogoogle
-from aiogoogle.excs import HTTPError
 from pyytlounge import YtLoungeApi
 from pyytlounge.dial import get_screen_id_from_dial
 
@@ -18,6 +17,7 @@ from homeassistant.components import ssdp
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 import aiohttp
 from .const import DOMAIN
@@ -25,6 +25,11 @@ from .util import device_name
 
 _LOGGER = logging.getLogger(__name__)
 
+DIAL_PROBE_TIMEOUT = 2.0
+
+GOOGLE_API_PROBE_URL = "https://www.googleapis.com/youtube/v3/videos"
+GOOGLE_API_PROBE_VIDEO_ID = "oa__fLArsFk"
+
 STEP_GOOGLE_API_DATA_SCHEMA = vol.Schema(
     {
         vol.Optional("google_api_key", description="google_api_key"): str,
@@ -47,23 +52,38 @@ class ConnectResult:
     auth: dict
 
 
-async def validate_google_api_key(api_key: str) -> dict[str, Any]:
+async def _pairing_api(hass: HomeAssistant) -> YtLoungeApi:
+    """Create a lounge api backed by Home Assistant's shared aiohttp session.
+
+    Reusing the shared session keeps the connection pool warm across flow
+    steps and retries instead of opening a new TCP pool per validation.
+    """
+    api = YtLoungeApi(device_name(hass))
+    await api.close()  # drop the private session created by the constructor
+    api.session = async_get_clientsession(hass)
+    return api
+
+
+async def validate_google_api_key(hass: HomeAssistant, api_key: str) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
 
     # supplying a key is optional
     if api_key:
-        async with Aiogoogle(api_key=api_key) as aiogoogle:
-            yt_api = await aiogoogle.discover("youtube", "v3")
-            request = yt_api.videos.list(part="snippet", id="oa__fLArsFk")
-            try:
-                await aiogoogle.as_api_key(request)
-            except HTTPError as ex:
-                if ex.res and ex.res.status_code == 400:
-                    raise InvalidAuth from ex
-                else:
-                    raise CannotConnect from ex
-            except Exception as ex:
-                raise CannotConnect from ex
+        # a single cheap probe request is enough to check the key, no need
+        # to fetch and parse the full discovery document first
+        session = async_get_clientsession(hass)
+        try:
+            async with session.get(
+                GOOGLE_API_PROBE_URL,
+                params={"part": "id", "id": GOOGLE_API_PROBE_VIDEO_ID, "key": api_key},
+            ) as response:
+                if response.status == 400:
+                    raise InvalidAuth
+                response.raise_for_status()
+        except InvalidAuth:
+            raise
+        except Exception as ex:
+            raise CannotConnect from ex
 
     return {}
 
@@ -76,20 +96,20 @@ async def validate_pairing_code(
     Data has the keys from STEP_PAIR_DATA_SCHEMA with values provided by the user.
     """
 
-    async with YtLoungeApi(device_name(hass)) as api:
-        try:
-            if await api.pair(pairing_code):
-                return ConnectResult(
-                    screen_name=api.screen_name,
-                    screen_id=api.auth.screen_id,
-                    auth=api.auth.serialize(),
-                )
-        except aiohttp.ClientConnectionError as exc:
-            raise CannotConnect from exc
-        except aiohttp.ClientError as exc:
-            raise InvalidAuth from exc
-        except Exception as exc:
-            raise InvalidAuth from exc
+    api = await _pairing_api(hass)
+    try:
+        if await api.pair(pairing_code):
+            return ConnectResult(
+                screen_name=api.screen_name,
+                screen_id=api.auth.screen_id,
+                auth=api.auth.serialize(),
+            )
+    except aiohttp.ClientConnectionError as exc:
+        raise CannotConnect from exc
+    except aiohttp.ClientError as exc:
+        raise InvalidAuth from exc
+    except Exception as exc:
+        raise InvalidAuth from exc
 
 
 async def validate_screen_id(
@@ -100,21 +120,21 @@ async def validate_screen_id(
     Data has the key screen_id with values provided by automatic discovery.
     """
 
-    async with YtLoungeApi(device_name(hass)) as api:
-        try:
-            if await api.pair_with_screen_id(screen_id, screen_name):
-                return ConnectResult(
-                    screen_name=api.screen_name,
-                    screen_id=api.auth.screen_id,
-                    auth=api.auth.serialize(),
-                )
+    api = await _pairing_api(hass)
+    try:
+        if await api.pair_with_screen_id(screen_id, screen_name):
+            return ConnectResult(
+                screen_name=api.screen_name,
+                screen_id=api.auth.screen_id,
+                auth=api.auth.serialize(),
+            )
 
-        except aiohttp.ClientConnectionError as exc:
-            raise CannotConnect from exc
-        except aiohttp.ClientError as exc:
-            raise InvalidAuth from exc
-        except:
-            raise InvalidAuth
+    except aiohttp.ClientConnectionError as exc:
+        raise CannotConnect from exc
+    except aiohttp.ClientError as exc:
+        raise InvalidAuth from exc
+    except:
+        raise InvalidAuth
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -134,7 +154,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             "Found DIAL device through SSDP, checking if YouTube is available..."
         )
 
-        dial_result = await get_screen_id_from_dial(discovery_info.ssdp_location)
+        try:
+            # local probe, keep the timeout tight so an offline TV does not
+            # stall the flow
+            dial_result = await asyncio.wait_for(
+                get_screen_id_from_dial(discovery_info.ssdp_location),
+                timeout=DIAL_PROBE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            return self.async_abort(reason="dial_timeout")
         if dial_result:
             _LOGGER.info(
                 "Found DIAL device through SSDP, YouTube is available: %s",
@@ -181,7 +209,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         try:
             if "google_api_key" in user_input:
-                await validate_google_api_key(user_input["google_api_key"])
+                await validate_google_api_key(self.hass, user_input["google_api_key"])
         except CannotConnect:
             errors["base"] = "cannot_connect"
         except InvalidAuth:
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import asyncio
 from asyncio import Task
+from copy import deepcopy
 import datetime as dt
+import random
+import time
 from typing import TypedDict
 
+import aiohttp
 from aiogoogle import Aiogoogle
+from aiogoogle.resource import GoogleAPI
+from aiogoogle.sessions.aiohttp_session import AiohttpSession
 from pyytlounge import PlaybackState, State as YtState, YtLoungeApi, get_thumbnail_url
 
 import homeassistant
 from homeassistant.components.media_player import (
-    MediaPlayerDeviceClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
@@ -65,74 +70,189 @@ class _VideoInfo:
         self.channel_title = snippet["channelTitle"]
 
 
+# snippets for the same video are shared between entities (multiple screens
+# often play the same video) and kept for an hour
+SNIPPET_CACHE_TTL = 3600
+SNIPPET_CACHE_MAX_SIZE = 256
+_SNIPPET_CACHE: dict[str, tuple[float, _VideoInfo]] = {}
+
+
+_YT_STATE_MAP = {
+    YtState.Playing: MediaPlayerState.PLAYING,
+    YtState.Starting: MediaPlayerState.PLAYING,
+    YtState.Buffering: MediaPlayerState.PLAYING,
+    YtState.Advertisement: MediaPlayerState.PLAYING,
+    YtState.Paused: MediaPlayerState.PAUSED,
+    YtState.Stopped: MediaPlayerState.ON,
+}
+
 CONNECT_RETRY_INTERVAL = 10
 ERROR_RETRY_INTERVAL = 30
 SUBSCRIBE_RETRY_INTERVAL = 1
+SUBSCRIPTION_CANCEL_TIMEOUT = 5
+SNIPPET_DEBOUNCE_INTERVAL = 0.3
+RETRY_BACKOFF_CAP = 300
+
+
+def _backoff_delay(base: float, attempt: int) -> float:
+    """Exponential backoff with jitter, so clients do not retry in lockstep."""
+    return min(RETRY_BACKOFF_CAP, base * 2**attempt) * (0.5 + random.random())
+
+
+def _prune_snippet_cache(now: float) -> None:
+    """Drop expired snippets, then the oldest ones if still over the limit."""
+    for video_id, (stored, _) in list(_SNIPPET_CACHE.items()):
+        if now - stored >= SNIPPET_CACHE_TTL:
+            del _SNIPPET_CACHE[video_id]
+    while len(_SNIPPET_CACHE) > SNIPPET_CACHE_MAX_SIZE:
+        oldest = min(_SNIPPET_CACHE, key=lambda vid: _SNIPPET_CACHE[vid][0])
+        del _SNIPPET_CACHE[oldest]
 
 
 class YtMediaPlayer(MediaPlayerEntity):
     """Media player entity for YouTube Lounge integration."""
 
+    _attr_has_entity_name = True
+    _attr_name = None  # use device name
+    _attr_device_class = None
+    _attr_supported_features = (
+        MediaPlayerEntityFeature.PAUSE
+        | MediaPlayerEntityFeature.PLAY
+        | MediaPlayerEntityFeature.PREVIOUS_TRACK
+        | MediaPlayerEntityFeature.NEXT_TRACK
+        | MediaPlayerEntityFeature.SEEK
+    )
+
     def __init__(
         self, entry: ConfigEntry, api: YtLoungeApi, api_key: str | None
     ) -> None:
         """Initialize media player entity with api and optional api key."""
         self._entry = entry
         self._api = api
+        self._attr_unique_id = api.auth.screen_id
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, api.auth.screen_id)},
+            manufacturer="YouTube",
+            name=f"YouTube on {entry.title}",
+        )
         self._google_api_key = api_key
+        self._aiogoogle: Aiogoogle | None = None
+        self._aiogoogle_session: AiohttpSession | None = None
         self._yt_api = None
 
         self._state_time = homeassistant.util.dt.utcnow()
         self._state: PlaybackState | None = None
+        self._state_fingerprint: tuple | None = None
         self._video_info: _VideoInfo | None = None
+        self._last_video_info: _VideoInfo | None = None
+        self._pending_video_ids: set[str] = set()
+        self._inflight_video_ids: set[str] = set()
+        self._snippet_fetch_handle: asyncio.TimerHandle | None = None
         self._subscription: Task | None = None
+        self._setup_task: Task | None = None
+        self._background_tasks: Task | None = None
 
     async def _setup_youtube_api(self):
-        async with Aiogoogle(api_key=self._google_api_key) as aiogoogle:
-            self._yt_api = await aiogoogle.discover("youtube", "v3")
+        # Aiogoogle binds its active session in a task-local ContextVar, so a
+        # session entered here would be invisible to the snippet fetch tasks.
+        # Own one session and hand it out through the factory instead, which
+        # send() calls whenever the current task has no session bound yet.
+        session = AiohttpSession()
+        self._aiogoogle_session = session
+        self._aiogoogle = Aiogoogle(
+            session_factory=lambda: session, api_key=self._google_api_key
+        )
+        # reuse the cached discovery document to skip fetching and parsing it
+        cached_doc = self._entry.data.get("yt_discovery_doc")
+        if cached_doc:
+            try:
+                # GoogleAPI mutates the document, keep the entry data intact
+                yt_api = GoogleAPI(discovery_document=deepcopy(cached_doc))
+                # constructing never fails, probe the method we actually use
+                if not callable(yt_api.videos.list):
+                    raise TypeError("videos.list is not callable")
+                self._yt_api = yt_api
+            except (AttributeError, KeyError, TypeError):
+                cached_doc = None  # schema changed, fetch a fresh document
+        if not cached_doc:
+            self._yt_api = await self._aiogoogle.discover("youtube", "v3")
+            self.hass.config_entries.async_update_entry(
+                self._entry,
+                data={
+                    **self._entry.data,
+                    "yt_discovery_doc": self._yt_api.discovery_document,
+                },
+            )
         if self._state and self._state.videoId:
             await self._update_video_snippet()
             self.async_write_ha_state()
 
     async def _subscription_task(self):
+        attempt = 0
         while True:
+            started = self.hass.loop.time()
             try:
                 LOGGER.debug("Starting subscribe and keep alive")
                 await self._subscribe_and_keep_alive()
             except asyncio.CancelledError:
                 break
-            except:
+            except Exception:  # retry on errors, but let base exceptions propagate
+                if self.hass.loop.time() - started > ERROR_RETRY_INTERVAL:
+                    attempt = 0  # ran for a while, treat as a fresh failure
+                delay = _backoff_delay(ERROR_RETRY_INTERVAL, attempt)
+                attempt += 1
                 LOGGER.exception(
                     "Subscribe and keep alive encountered error, waiting %.0f seconds",
-                    ERROR_RETRY_INTERVAL,
+                    delay,
                 )
-                await asyncio.sleep(ERROR_RETRY_INTERVAL)
+                await asyncio.sleep(delay)
 
     async def _subscribe_and_keep_alive(self):
         if not self._api.connected():
             await self._api.connect()
 
         while True:
+            attempt = 0
             while not self._api.connected():
                 LOGGER.debug("subscribe_and_keep_alive: reconnecting")
                 await self._new_state(None)
-                await asyncio.sleep(CONNECT_RETRY_INTERVAL)
+                await asyncio.sleep(_backoff_delay(CONNECT_RETRY_INTERVAL, attempt))
+                attempt += 1
                 if not self._api.linked():
-                    await self._api.refresh_auth()
+                    if await self._api.refresh_auth():
+                        self._persist_auth()
                 await self._api.connect()
             LOGGER.debug("subscribe_and_keep_alive: subscribing")
             await self._api.subscribe(self._new_state)
             await asyncio.sleep(SUBSCRIBE_RETRY_INTERVAL)
 
+    def _persist_auth(self) -> None:
+        """Store refreshed auth in the config entry for the next startup."""
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            data={**self._entry.data, "auth": self._api.auth.serialize()},
+        )
+
     async def manual_reconnect(self):
         """Refresh the authorization of the api, to manually fix broken connections."""
         if self._subscription:
             LOGGER.debug("manual_reconnect: cancelling subscription")
             self._subscription.cancel()
             LOGGER.debug("manual_reconnect: waiting for subscription to end")
-            await self._subscription
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(self._subscription),
+                    timeout=SUBSCRIPTION_CANCEL_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                LOGGER.warning(
+                    "manual_reconnect: subscription did not stop within %d seconds",
+                    SUBSCRIPTION_CANCEL_TIMEOUT,
+                )
             refreshed = await self._api.refresh_auth()
             LOGGER.debug("manual_reconnect: refresh auth %s", refreshed)
+            if refreshed:
+                self._persist_auth()
             connected = await self._api.connect()
             LOGGER.debug("manual_reconnect: connect %s", connected)
         self._subscription = self._entry.async_create_background_task(
@@ -143,101 +263,160 @@ class YtMediaPlayer(MediaPlayerEntity):
         """Connect and subscribe to dispatcher signals and state updates."""
         await super().async_added_to_hass()
 
-        self._subscription = self._entry.async_create_background_task(
-            self.hass, self._subscription_task(), "Subscription"
+        self._background_tasks = self._entry.async_create_background_task(
+            self.hass, self._run_background_tasks(), "YouTube lounge tasks"
         )
 
-        if self._google_api_key:
-            self._entry.async_create_task(
-                self.hass, self._setup_youtube_api(), "Setup youtube api"
-            )
-
         self.async_on_remove(self._removed_from_hass)
 
+    async def _run_background_tasks(self) -> None:
+        """Run the subscription and youtube api setup under one task group.
+
+        Cancelling this task cancels both children, so teardown cannot
+        leave stray tasks behind.
+        """
+        async with asyncio.TaskGroup() as tg:
+            self._subscription = tg.create_task(self._subscription_task())
+            if self._google_api_key:
+                self._setup_task = tg.create_task(self._guarded_setup_youtube_api())
+
+    async def _guarded_setup_youtube_api(self) -> None:
+        # a youtube api failure should not take down the subscription with it
+        try:
+            await self._setup_youtube_api()
+        except Exception:
+            LOGGER.exception("Setting up youtube api failed")
+
     def _removed_from_hass(self) -> None:
+        if self._snippet_fetch_handle:
+            self._snippet_fetch_handle.cancel()
+            self._snippet_fetch_handle = None
         if self._subscription:
             self._subscription.cancel()
             self._subscription = None
+        if self._background_tasks:
+            self._background_tasks.cancel()
+            self._background_tasks = None
+        if self._aiogoogle_session:
+            # close the owned session directly; Aiogoogle's __aexit__ only
+            # sees a session from the task that entered it
+            self.hass.async_create_task(self._aiogoogle_session.close())
+            self._aiogoogle_session = None
+        self._aiogoogle = None
+        self._yt_api = None
 
     async def _update_video_snippet(self):
         if self._yt_api and self._state and self._state.videoId:
-            if self._video_info and self._state.videoId == self._video_info.id:
+            video_id = self._state.videoId
+            if self._video_info and video_id == self._video_info.id:
                 return  # already have this video info
 
-            async with Aiogoogle(api_key=self._google_api_key) as aiogoogle:
-                request = self._yt_api.videos.list(
-                    part="snippet", id=self._state.videoId
+            if self._last_video_info and video_id == self._last_video_info.id:
+                # same video as before a reconnect blip, reuse the snippet
+                self._video_info = self._last_video_info
+                return
+
+            hit = _SNIPPET_CACHE.get(video_id)
+            if hit and time.monotonic() - hit[0] < SNIPPET_CACHE_TTL:
+                self._video_info = hit[1]
+                self._last_video_info = hit[1]
+                return
+
+            if video_id in self._inflight_video_ids or (
+                video_id in self._pending_video_ids
+                and self._snippet_fetch_handle is not None
+            ):
+                return  # this video's snippet is already queued or being fetched
+
+            # clear the previous video's info so the state written before the
+            # fetch completes does not pair it with the new video
+            self._video_info = None
+
+            # coalesce rapid video changes into one batched videos.list call
+            self._pending_video_ids.add(video_id)
+            if self._snippet_fetch_handle is None:
+                self._snippet_fetch_handle = self.hass.loop.call_later(
+                    SNIPPET_DEBOUNCE_INTERVAL, self._schedule_snippet_fetch
                 )
-                response = await aiogoogle.as_api_key(request)
-                snippet = response["items"][0]["snippet"]
-                self._video_info = _VideoInfo(self._state.videoId, snippet)
         else:
             self._video_info = None
 
+    def _schedule_snippet_fetch(self) -> None:
+        self._snippet_fetch_handle = None
+        if not self._pending_video_ids or not self._yt_api:
+            return
+        video_ids = self._pending_video_ids.copy()
+        self._pending_video_ids.clear()
+        self._inflight_video_ids |= video_ids
+        self._entry.async_create_task(
+            self.hass, self._fetch_snippets(video_ids), "Fetch video snippets"
+        )
+
+    async def _fetch_snippets(self, video_ids: set[str]) -> None:
+        try:
+            if not self._aiogoogle or not self._aiogoogle_session or not self._yt_api:
+                return  # client was closed between scheduling and running
+            now = time.monotonic()
+            # another entity may have fetched some of these in the meantime
+            to_fetch = {
+                video_id
+                for video_id in video_ids
+                if not (hit := _SNIPPET_CACHE.get(video_id))
+                or now - hit[0] >= SNIPPET_CACHE_TTL
+            }
+            if to_fetch:
+                try:
+                    request = self._yt_api.videos.list(
+                        part="snippet", id=",".join(to_fetch)
+                    )
+                    response = await self._aiogoogle.as_api_key(request)
+                except Exception:
+                    LOGGER.exception("Fetching video snippets failed")
+                    return
+                now = time.monotonic()
+                for item in response["items"]:
+                    _SNIPPET_CACHE[item["id"]] = (
+                        now,
+                        _VideoInfo(item["id"], item["snippet"]),
+                    )
+                if len(_SNIPPET_CACHE) > SNIPPET_CACHE_MAX_SIZE:
+                    _prune_snippet_cache(now)
+            current_id = self._state and self._state.videoId
+            hit = _SNIPPET_CACHE.get(current_id) if current_id else None
+            if hit:
+                self._video_info = hit[1]
+                self._last_video_info = self._video_info
+                self.async_write_ha_state()
+        finally:
+            self._inflight_video_ids -= video_ids
+
     async def _new_state(self, state: PlaybackState | None):
+        fingerprint = (
+            (state.state, state.videoId, int(state.currentTime), int(state.duration))
+            if state
+            else None
+        )
         self._state_time = homeassistant.util.dt.utcnow()
         self._state = state
+        if self._yt_api is None and self._setup_task and not self._setup_task.done():
+            # the first state can arrive while discovery is still running;
+            # wait for it so the snippet shows up right away
+            try:
+                await self._setup_task
+            except Exception:
+                LOGGER.exception("Setting up youtube api failed")
+        if fingerprint == self._state_fingerprint:
+            return  # heartbeat without changes, skip snippet lookup and dispatch
+        self._state_fingerprint = fingerprint
         await self._update_video_snippet()
         self.async_write_ha_state()
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._api.auth.screen_id
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Return if the name of the entity is describing only the entity itself."""
-        return True
-
-    @property
-    def name(self):
-        """Name of the entity."""
-        # return None to use device name
-        return None
-
     @property
     def state(self) -> MediaPlayerState:
         """State of the player."""
         if not self._state:
             return MediaPlayerState.OFF
-        if self._state.state in [
-            YtState.Playing,
-            YtState.Starting,
-            YtState.Buffering,
-            YtState.Advertisement,
-        ]:
-            return MediaPlayerState.PLAYING
-        if self._state.state == YtState.Paused:
-            return MediaPlayerState.PAUSED
-        if self._state.state == YtState.Stopped:
-            return MediaPlayerState.ON
-        return MediaPlayerState.OFF
-
-    @property
-    def supported_features(self) -> MediaPlayerEntityFeature:
-        """Flag media player features that are supported."""
-        return (
-            MediaPlayerEntityFeature.PAUSE
-            | MediaPlayerEntityFeature.PLAY
-            | MediaPlayerEntityFeature.PREVIOUS_TRACK
-            | MediaPlayerEntityFeature.NEXT_TRACK
-            | MediaPlayerEntityFeature.SEEK
-        )
-
-    @property
-    def device_class(self) -> MediaPlayerDeviceClass | None:
-        """Return the class of this entity."""
-        return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._api.auth.screen_id)},
-            manufacturer="YouTube",
-            name=f"YouTube on {self._entry.title}",
-        )
+        return _YT_STATE_MAP.get(self._state.state, MediaPlayerState.OFF)
 
     @property
     def media_title(self) -> str | None:
@@ -275,6 +454,22 @@ class YtMediaPlayer(MediaPlayerEntity):
 
         return None
 
+    async def _async_fetch_image(self, url: str) -> tuple[bytes | None, str | None]:
+        """Fetch the thumbnail over the pooled lounge api session.
+
+        Only the transport is swapped; Home Assistant's image cache in
+        front of this hook still applies. Reusing the session keeps the
+        connection to the thumbnail host warm instead of a TLS handshake
+        per video change.
+        """
+        try:
+            async with self._api.session.get(url) as response:
+                if response.status != 200:
+                    return None, None
+                return await response.read(), response.content_type
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None, None
+
     async def async_media_pause(self) -> None:
         """Send pause command."""
         return await self._api.pause()
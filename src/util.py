@@ -1,9 +1,26 @@
 """Utility for youtube lounge integration."""
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_DEVICE_NAME_KEY = "_device_name"
 
 
 def device_name(hass: HomeAssistant) -> str:
-    """Get device name to show on YouTube."""
+    """Get device name to show on YouTube, cached per Home Assistant instance."""
+
+    data = hass.data.setdefault(DOMAIN, {})
+    name = data.get(_DEVICE_NAME_KEY)
+    if name is None:
+        name = f"Home Assistant {hass.config.location_name}"
+        data[_DEVICE_NAME_KEY] = name
+
+        @callback
+        def _invalidate(_event) -> None:
+            # location name may have changed, recompute on next use
+            data.pop(_DEVICE_NAME_KEY, None)
 
-    return f"Home Assistant {hass.config.location_name}"
+        hass.bus.async_listen_once(EVENT_CORE_CONFIG_UPDATE, _invalidate)
+    return name